@@ -11,7 +11,7 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 
 from .base import spmatrix, _ufuncs_with_fixed_point_at_zero
-from .sputils import isscalarlike, validateaxis
+from .sputils import isscalarlike, upcast_scalar, validateaxis
 
 __all__ = []
 
@@ -38,10 +38,10 @@ class _data_matrix(spmatrix):
         return self._with_data(abs(self._deduped_data()))
 
     def _real(self):
-        return self._with_data(self.data.real)
+        return self._with_data(np.ascontiguousarray(self.data.real))
 
     def _imag(self):
-        return self._with_data(self.data.imag)
+        return self._with_data(np.ascontiguousarray(self.data.imag))
 
     def __neg__(self):
         if self.dtype.kind == 'b':
@@ -51,7 +51,9 @@ class _data_matrix(spmatrix):
 
     def __imul__(self, other):  # self *= other
         if isscalarlike(other):
-            self.data *= other
+            if other == 1 and upcast_scalar(self.dtype, other) == self.dtype:
+                return self
+            np.multiply(self.data, other, out=self.data)
             return self
         else:
             return NotImplemented
@@ -59,7 +61,9 @@ class _data_matrix(spmatrix):
     def __itruediv__(self, other):  # self /= other
         if isscalarlike(other):
             recip = 1.0 / other
-            self.data *= recip
+            if recip == 1 and upcast_scalar(self.dtype, recip) == self.dtype:
+                return self
+            np.multiply(self.data, recip, out=self.data)
             return self
         else:
             return NotImplemented
@@ -107,7 +111,7 @@ class _data_matrix(spmatrix):
 
         data = self._deduped_data()
         if dtype is not None:
-            data = data.astype(dtype)
+            data = data.astype(dtype, copy=False)
         return self._with_data(data ** n)
 
     ###########################
@@ -115,6 +119,9 @@ class _data_matrix(spmatrix):
     ###########################
 
     def _mul_scalar(self, other):
+        # multiplying by one only needs a copy, unless it changes the dtype
+        if other == 1 and upcast_scalar(self.dtype, other) == self.dtype:
+            return self.copy()
         return self._with_data(self.data * other)
 
 
@@ -195,7 +202,7 @@ class _minmax_mixin(object):
             if self.nnz == 0:
                 return zero
             m = min_or_max.reduce(self._deduped_data().ravel())
-            if self.nnz != np.product(self.shape):
+            if self.nnz != self.shape[0] * self.shape[1]:
                 m = min_or_max(zero, m)
             return m
 
@@ -268,7 +275,7 @@ class _minmax_mixin(object):
                 if compare(m, zero):
                     return mat.row[am] * mat.shape[1] + mat.col[am]
                 else:
-                    size = np.product(mat.shape)
+                    size = mat.shape[0] * mat.shape[1]
                     if size == mat.nnz:
                         return am
                     else:
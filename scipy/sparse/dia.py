@@ -128,7 +128,7 @@ class dia_matrix(_data_matrix):
             self._shape = check_shape(A.shape)
 
         if dtype is not None:
-            self.data = self.data.astype(dtype)
+            self.data = self.data.astype(dtype, copy=False)
 
         #check format
         if self.offsets.ndim != 1:
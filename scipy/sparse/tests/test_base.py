@@ -675,11 +675,13 @@ class _TestCommon(object):
         D = matrix([[1 + 3j, 2 - 4j]])
         A = self.spmatrix(D)
         assert_equal(A.real.todense(),D.real)
+        assert_(A.real.data.flags.c_contiguous)
 
     def test_imag(self):
         D = matrix([[1 + 3j, 2 - 4j]])
         A = self.spmatrix(D)
         assert_equal(A.imag.todense(),D.imag)
+        assert_(A.imag.data.flags.c_contiguous)
 
     def test_diagonal(self):
         # Does the matrix's .diagonal() method work?
@@ -1265,6 +1267,10 @@ class _TestCommon(object):
             assert_array_equal(dat*2,(datsp*2).todense())
             assert_array_equal(dat*17.3,(datsp*17.3).todense())
 
+            # multiplying by one must not change the dtype
+            assert_array_equal(dat*1,(datsp*1).todense())
+            assert_equal((dat*1.0).dtype,(datsp*1.0).dtype)
+
         for dtype in self.math_dtypes:
             check(dtype)
 
@@ -2182,6 +2188,11 @@ class _TestInplaceArithmetic(object):
             datsp = self.datsp_dtypes[dtype]
 
             # Avoid implicit casting.
+            if np.can_cast(type(1), dtype, casting='same_kind'):
+                a = datsp.copy()
+                a *= 1
+                assert_array_equal(dat, a.todense())
+
             if np.can_cast(type(2), dtype, casting='same_kind'):
                 a = datsp.copy()
                 a *= 2
@@ -2204,6 +2215,11 @@ class _TestInplaceArithmetic(object):
             dat = self.dat_dtypes[dtype]
             datsp = self.datsp_dtypes[dtype]
 
+            if np.can_cast(type(1), dtype, casting='same_kind'):
+                a = datsp.copy()
+                a /= 1
+                assert_array_equal(dat, a.todense())
+
             if np.can_cast(type(2), dtype, casting='same_kind'):
                 a = datsp.copy()
                 a /= 2
@@ -4320,6 +4336,16 @@ class TestBSR(sparse_test_class(getset=False,
         indices = np.arange(n, dtype=np.int32)
         bsr_matrix((data, indices, indptr), blocksize=(n, 1), copy=False)
 
+    def test_constructor5(self):
+        # a dtype matching the data should not force a copy
+        data = np.ones((2, 2, 2))
+        indptr = np.array([0, 1, 2])
+        indices = np.array([0, 1])
+        A = bsr_matrix((data, indices, indptr), dtype=data.dtype, copy=False)
+        assert_(A.data is data)
+        A = bsr_matrix((data, indices, indptr), dtype=data.dtype, copy=True)
+        assert_(not np.may_share_memory(A.data, data))
+
     def test_eliminate_zeros(self):
         data = kron([1, 0, 0, 0, 2, 0, 3, 0], [[1,1],[1,1]]).T
         data = data.reshape(-1,2,2)